@@ -40,13 +40,17 @@ def main():
     config[section] = {}
     config.read(sys.argv[1])
 
+    modified = False
     if not config[section].get("email"):
         config[section]["email"] = input("E-mail: ")
+        modified = True
     if not config[section].get("password"):
         config[section]["password"] = getpass()
+        modified = True
 
-    with open(sys.argv[1], "w") as f:
-        config.write(f)
+    if modified:
+        with open(sys.argv[1], "w") as f:
+            config.write(f)
 
     client = sunnyportal.client.Client(
         config[section]["email"], config[section]["password"]
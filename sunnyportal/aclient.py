@@ -0,0 +1,187 @@
+# Copyright (c) 2016 Erik Johansson <erik@ejohansson.se>
+#
+# This program is free software; you can redistribute it and/or
+# modify it under the terms of the GNU General Public License as
+# published by the Free Software Foundation; either version 3 of the
+# License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful, but
+# WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+# General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program; if not, write to the Free Software
+# Foundation, Inc., 59 Temple Place, Suite 330, Boston, MA 02111-1307
+# USA
+
+from . import requests
+from .client import _SSL_CONTEXT
+
+import asyncio
+import http.client as http
+import logging
+
+import aiohttp
+
+
+class AsyncClient(object):
+    """Asynchronous variant of client.Client built on aiohttp.
+
+    Independent requests (e.g. one day overview per day of a year) are
+    issued concurrently over a bounded connection pool instead of one
+    at a time.
+    """
+
+    def __init__(
+        self,
+        username,
+        password,
+        server="com.sunny-portal.de",
+        port=http.HTTPS_PORT,
+        connection_limit=8,
+    ):
+        super().__init__()
+        self.log = logging.getLogger(__name__)
+        self.username = username
+        self.password = password
+        self.server = server
+        self.port = port
+        self.connection_limit = connection_limit
+        self.token = None
+        self._session = None
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.close()
+
+    def _get_session(self):
+        if self._session is None:
+            self._session = aiohttp.ClientSession(
+                base_url="https://%s:%d" % (self.server, self.port),
+                connector=aiohttp.TCPConnector(
+                    limit=self.connection_limit, ssl=_SSL_CONTEXT
+                ),
+            )
+        return self._session
+
+    async def close(self):
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+
+    async def do_request(self, request):
+        return await request.aperform(self._get_session())
+
+    async def get_token(self):
+        if self.token is None:
+            req = requests.AuthenticationRequest(self.username, self.password)
+            self.token = await self.do_request(req)
+        return self.token
+
+    async def logout(self):
+        if self.token is None:
+            return
+        req = requests.LogoutRequest(await self.get_token())
+        await self.do_request(req)
+        self.token = None
+        await self.close()
+
+    async def get_plants(self):
+        req = requests.PlantListRequest(await self.get_token())
+        res = await self.do_request(req)
+        return [AsyncPlant(self, p["oid"], p["name"]) for p in res.plants]
+
+
+class AsyncPlant(object):
+    def __init__(self, client, oid, name):
+        self.client = client
+        self.oid = oid
+        self.name = name
+
+    async def get_token(self):
+        return await self.client.get_token()
+
+    async def profile(self):
+        req = requests.PlantProfileRequest(await self.get_token(), self.oid)
+        return await self.client.do_request(req)
+
+    async def get_devices(self):
+        req = requests.PlantDeviceListRequest(await self.get_token(), self.oid)
+        res = await self.client.do_request(req)
+        return [
+            AsyncDevice(self.client, self, d["oid"], d["name"]) for d in res.devices
+        ]
+
+    async def last_data_exact(self, date):
+        req = requests.LastDataExactRequest(await self.get_token(), self.oid, date)
+        return await self.client.do_request(req)
+
+    async def all_data(self, interval):
+        req = requests.AllDataRequest(await self.get_token(), self.oid, interval)
+        return await self.client.do_request(req)
+
+    async def day_overview(self, date, quarter=True, include_all=False):
+        req = requests.DayOverviewRequest(
+            await self.get_token(), self.oid, date, quarter, include_all
+        )
+        return await self.client.do_request(req)
+
+    async def day_overviews(self, dates, quarter=True, include_all=False):
+        """Fetch day overviews for all dates concurrently."""
+        return await asyncio.gather(
+            *(self.day_overview(d, quarter, include_all) for d in dates)
+        )
+
+    async def month_overview(self, date):
+        req = requests.MonthOverviewRequest(await self.get_token(), self.oid, date)
+        return await self.client.do_request(req)
+
+    async def year_overview(self, date):
+        req = requests.YearOverviewRequest(await self.get_token(), self.oid, date)
+        return await self.client.do_request(req)
+
+    async def year_energy_balance(self, date):
+        req = requests.EnergyBalanceRequest(
+            await self.get_token(), self.oid, date=date, period="year", interval="month"
+        )
+        return await self.client.do_request(req)
+
+    async def month_energy_balance(self, date):
+        req = requests.EnergyBalanceRequest(
+            await self.get_token(), self.oid, date=date, period="month", interval="day"
+        )
+        return await self.client.do_request(req)
+
+    async def day_energy_balance(self, date):
+        req = requests.EnergyBalanceRequest(
+            await self.get_token(), self.oid, date=date, period="day", interval="day"
+        )
+        return await self.client.do_request(req)
+
+    async def logbook(
+        self, date_from=None, info=True, warning=True, failure=True, error=True
+    ):
+        req = requests.LogbookRequest(
+            await self.get_token(), self.oid, date_from, info, warning, failure, error
+        )
+        return await self.client.do_request(req)
+
+
+class AsyncDevice(object):
+    def __init__(self, client, plant, oid, name):
+        self.client = client
+        self.plant = plant
+        self.oid = oid
+        self.name = name
+
+    async def get_token(self):
+        return await self.client.get_token()
+
+    async def get_parameters(self):
+        req = requests.PlantDeviceParametersRequest(
+            await self.get_token(), self.plant.oid, self.oid
+        )
+        return await self.client.do_request(req)
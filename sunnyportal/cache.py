@@ -0,0 +1,57 @@
+# Copyright (c) 2016 Erik Johansson <erik@ejohansson.se>
+#
+# This program is free software; you can redistribute it and/or
+# modify it under the terms of the GNU General Public License as
+# published by the Free Software Foundation; either version 3 of the
+# License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful, but
+# WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+# General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program; if not, write to the Free Software
+# Foundation, Inc., 59 Temple Place, Suite 330, Boston, MA 02111-1307
+# USA
+
+import logging
+import os
+import shelve
+
+
+class ResponseCache(object):
+    """Persistent cache for raw API responses.
+
+    Overview data for dates in the past never changes, so the raw XML
+    can be stored on disk and reused on later runs instead of being
+    downloaded again.
+    """
+
+    def __init__(self, cache_dir):
+        super().__init__()
+        self.log = logging.getLogger(__name__)
+        self.cache_dir = cache_dir
+        self._shelf = None
+
+    def _open(self):
+        if self._shelf is None:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            self._shelf = shelve.open(os.path.join(self.cache_dir, "responses"))
+        return self._shelf
+
+    def get(self, key):
+        data = self._open().get(key)
+        if data is not None:
+            self.log.debug("Cache hit for %s", key)
+        return data
+
+    def put(self, key, data):
+        shelf = self._open()
+        shelf[key] = data
+        shelf.sync()
+
+    def close(self):
+        if self._shelf is not None:
+            self._shelf.close()
+            self._shelf = None
@@ -15,16 +15,28 @@
 # Foundation, Inc., 59 Temple Place, Suite 330, Boston, MA 02111-1307
 # USA
 
-from . import requests
+from . import cache, requests
+
+from datetime import date as date_type, datetime, timedelta
 
 import http.client as http
 import logging
 import ssl
 
+# One context shared by every connection; building it loads the system
+# CA store, which only needs to happen once per process.
+_SSL_CONTEXT = ssl.create_default_context()
+_SSL_CONTEXT.check_hostname = True
+
 
 class Client(object):
     def __init__(
-        self, username, password, server="com.sunny-portal.de", port=http.HTTPS_PORT
+        self,
+        username,
+        password,
+        server="com.sunny-portal.de",
+        port=http.HTTPS_PORT,
+        cache_dir=None,
     ):
         super().__init__()
         self.log = logging.getLogger(__name__)
@@ -33,17 +45,50 @@ class Client(object):
         self.server = server
         self.port = port
         self.token = None
+        self._conn = None
+        self._ssl_context = self.create_ssl_context()
+        self.cache = cache.ResponseCache(cache_dir) if cache_dir else None
 
     def create_ssl_context(self):
-        context = ssl.create_default_context()
-        context.check_hostname = True
-        return context
-
-    def do_request(self, request):
-        conn = http.HTTPSConnection(
-            self.server, self.port, context=self.create_ssl_context()
-        )
-        return request.perform(conn)
+        return _SSL_CONTEXT
+
+    def close(self):
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+        if self.cache is not None:
+            self.cache.close()
+
+    def _execute(self, request):
+        if self._conn is None:
+            self._conn = http.HTTPSConnection(
+                self.server, self.port, context=self._ssl_context
+            )
+        try:
+            return request.execute(self._conn)
+        except (http.BadStatusLine, ConnectionResetError):
+            # The server closed the keep-alive connection; reconnect and
+            # retry once.
+            self._conn.close()
+            self._conn = http.HTTPSConnection(
+                self.server, self.port, context=self._ssl_context
+            )
+            return request.execute(self._conn)
+
+    def do_request(self, request, cache_key=None):
+        if self.cache is not None and cache_key is not None:
+            data = self.cache.get(cache_key)
+            if data is not None:
+                return request.handle_response(data)
+
+        data = self._execute(request)
+        # Parse before caching; the portal reports errors in-band as
+        # HTTP-200 XML and those must not be replayed from the cache.
+        response = request.handle_response(data)
+
+        if self.cache is not None and cache_key is not None:
+            self.cache.put(cache_key, data)
+        return response
 
     def get_token(self):
         if self.token is None:
@@ -57,11 +102,12 @@ class Client(object):
         req = requests.LogoutRequest(self.get_token())
         self.do_request(req)
         self.token = None
+        self.close()
 
     def get_plants(self):
         req = requests.PlantListRequest(self.get_token())
         res = self.do_request(req)
-        return [Plant(self, p["oid"], p["name"]) for p in res.plants]
+        return (Plant(self, p["oid"], p["name"]) for p in res.plants)
 
 
 class Plant(object):
@@ -73,6 +119,18 @@ class Plant(object):
     def get_token(self):
         return self.client.get_token()
 
+    def _cache_key(self, kind, last_day):
+        if self.client.cache is None:
+            return None
+        # The overview methods accept both date and datetime arguments.
+        if isinstance(last_day, datetime):
+            last_day = last_day.date()
+        # Only cache periods that ended well in the past; recent data can
+        # still be updated by the portal.
+        if last_day < date_type.today() - timedelta(days=2):
+            return "%s/%s/%s" % (self.oid, kind, last_day.isoformat())
+        return None
+
     def profile(self):
         req = requests.PlantProfileRequest(self.get_token(), self.oid)
         return self.client.do_request(req)
@@ -94,15 +152,34 @@ class Plant(object):
         req = requests.DayOverviewRequest(
             self.get_token(), self.oid, date, quarter, include_all
         )
-        return self.client.do_request(req)
+        key = self._cache_key("day-overview-%d-%d" % (quarter, include_all), date)
+        return self.client.do_request(req, cache_key=key)
+
+    def day_overviews(self, dates, quarter=True, include_all=False):
+        """Fetch a day overview for each date in dates.
+
+        All requests reuse the client's keep-alive connection, so only
+        the first one pays for the TCP/TLS handshake. For concurrent
+        fetches, see aclient.AsyncPlant.day_overviews.
+        """
+        return [self.day_overview(d, quarter, include_all) for d in dates]
 
     def month_overview(self, date):
         req = requests.MonthOverviewRequest(self.get_token(), self.oid, date)
-        return self.client.do_request(req)
+        # The month is immutable once the next month has begun.
+        if date.month == 12:
+            last_day = date.replace(year=date.year + 1, month=1, day=1)
+        else:
+            last_day = date.replace(month=date.month + 1, day=1)
+        key = self._cache_key("month-overview", last_day)
+        return self.client.do_request(req, cache_key=key)
 
     def year_overview(self, date):
         req = requests.YearOverviewRequest(self.get_token(), self.oid, date)
-        return self.client.do_request(req)
+        key = self._cache_key(
+            "year-overview", date.replace(year=date.year + 1, month=1, day=1)
+        )
+        return self.client.do_request(req, cache_key=key)
 
     def year_energy_balance(self, date):
         req = requests.EnergyBalanceRequest(
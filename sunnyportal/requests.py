@@ -20,12 +20,33 @@ from . import responses
 from datetime import datetime
 
 import base64
+import functools
+import gzip
 import hashlib
 import hmac
 import http.client as http
 import logging
 import urllib.parse
 
+# Partially fed HMACs keyed by (key, method, service). The first part of
+# the signature input is invariant for a given request class and token,
+# so it is fed once and the per-request signature starts from a copy.
+_HMAC_BASES = {}
+
+# URL path segments (plant/device oids, data types) repeat across
+# requests; memoize the percent-encoding.
+_quote = functools.lru_cache(maxsize=1024)(urllib.parse.quote)
+
+
+def _get_hmac(key, method, service):
+    base = _HMAC_BASES.get((key, method, service))
+    if base is None:
+        base = hmac.new(key.encode(), digestmod=hashlib.sha1)
+        base.update(method.encode())
+        base.update(service.encode())
+        _HMAC_BASES[(key, method, service)] = base
+    return base.copy()
+
 
 class RequestBase(object):
     def __init__(self, service, token=None, method="GET"):
@@ -40,37 +61,42 @@ class RequestBase(object):
 
     def get_timestamp(self, offset):
         timestamp = datetime.now() - offset
-        return timestamp.strftime("%Y-%m-%dT%H:%M:%S")
+        return timestamp.isoformat(timespec="seconds")
 
-    def prepare_url(self, segments, params={}):
+    def prepare_url(self, segments, params=()):
+        params = list(params.items() if isinstance(params, dict) else params)
         if self.token is not None:
-            sig = hmac.new(self.token.key.encode(), digestmod=hashlib.sha1)
-            sig.update(self.method.lower().encode())
-            sig.update(self.service.lower().encode())
+            sig = _get_hmac(self.token.key, self.method.lower(), self.service.lower())
 
             ts = self.get_timestamp(self.token.server_offset)
-            sig.update(ts.encode())
-            params["timestamp"] = ts
-
-            sig.update(self.token.identifier.lower().encode())
+            sig.update(ts.encode() + self.token.identifier_lower_bytes)
 
-            params["signature-method"] = "auth"
-            params["signature-version"] = self.version
-            params["signature"] = base64.standard_b64encode(sig.digest())
+            params.append(("timestamp", ts))
+            params.append(("signature-method", "auth"))
+            params.append(("signature-version", self.version))
+            params.append(
+                ("signature", base64.standard_b64encode(sig.digest()).decode("ascii"))
+            )
 
         self.url = "%s/%s/%d/" % (self.base_path, self.service, self.version)
-        self.url += "/".join([urllib.parse.quote(s) for s in segments])
+        self.url += "/".join([_quote(s) for s in segments])
         if params:
             self.url += "?%s" % urllib.parse.urlencode(params)
 
     def log_request(self, method, url):
         self.log.debug("%s %s", method, url)
 
-    def perform(self, connection):
+    def execute(self, connection):
         assert self.url is not None
 
         self.log_request(self.method, self.url)
-        connection.request(self.method, self.url)
+        # Ask the server to keep the connection open so that the client
+        # can reuse it for the next request.
+        connection.request(
+            self.method,
+            self.url,
+            headers={"Connection": "keep-alive", "Accept-Encoding": "gzip"},
+        )
 
         response = connection.getresponse()
         if response.status != http.OK:
@@ -80,7 +106,26 @@ class RequestBase(object):
                 )
             )
 
-        data = response.read().decode("utf-8")
+        data = response.read()
+        if response.getheader("Content-Encoding") == "gzip":
+            data = gzip.decompress(data)
+        return data.decode("utf-8")
+
+    def perform(self, connection):
+        return self.handle_response(self.execute(connection))
+
+    async def aperform(self, session):
+        assert self.url is not None
+
+        self.log_request(self.method, self.url)
+        async with session.request(self.method, self.url) as response:
+            if response.status != http.OK:
+                raise RuntimeError(
+                    "HTTP error performing {} request: {} {}".format(
+                        self.service, response.status, response.reason
+                    )
+                )
+            data = await response.text()
         return self.handle_response(data)
 
 
@@ -88,7 +133,7 @@ class AuthenticationRequest(RequestBase):
     def __init__(self, username, password):
         super().__init__(service="authentication")
         self.password = password
-        self.prepare_url([username], {"password": password})
+        self.prepare_url([username], (("password", password),))
 
     def log_request(self, method, url):
         password = urllib.parse.quote_plus(self.password)
@@ -121,12 +166,12 @@ class PlantRequest(RequestBase):
         super().__init__(service="plant", token=token)
         self.prepare_url(
             [oid],
-            {
-                "view": view,
-                "culture": "en-gb",
-                "plant-image-size": "64px",
-                "identifier": token.identifier,
-            },
+            (
+                ("view", view),
+                ("culture", "en-gb"),
+                ("plant-image-size", "64px"),
+                ("identifier", token.identifier),
+            ),
         )
 
 
@@ -141,17 +186,16 @@ class PlantProfileRequest(PlantRequest):
 class PlantDeviceListRequest(RequestBase):
     def __init__(self, token, oid):
         super().__init__(service="device", token=token)
-        self.prepare_url([oid], {"identifier": token.identifier})
+        self.prepare_url([oid], (("identifier", token.identifier),))
 
     def handle_response(self, data):
         return responses.PlantDeviceListResponse(data)
 
 
 class PlantDeviceRequest(RequestBase):
-    def __init__(self, token, plant_oid, device_oid, view, params={}):
+    def __init__(self, token, plant_oid, device_oid, view, params=()):
         super().__init__(service="device", token=token)
-        params["view"] = view
-        params["identifier"] = token.identifier
+        params = (*params, ("view", view), ("identifier", token.identifier))
         self.prepare_url([plant_oid, device_oid], params)
 
 
@@ -164,17 +208,17 @@ class PlantDeviceParametersRequest(PlantDeviceRequest):
 
 
 class DataRequest(RequestBase):
-    def __init__(self, token, oid, data_type, date, params={}):
+    def __init__(self, token, oid, data_type, date, params=()):
         super().__init__(service="data", token=token)
-        params["culture"] = "en-gb"
-        params["identifier"] = token.identifier
+        params = (*params, ("culture", "en-gb"), ("identifier", token.identifier))
         self.prepare_url([oid, data_type, date.strftime("%Y-%m-%d")], params)
 
 
 class LastDataExactRequest(DataRequest):
+    _BASE_PARAMS = (("unit", "kWh"), ("view", "lastdataexact"))
+
     def __init__(self, token, oid, date):
-        params = {"unit": "kWh", "view": "lastdataexact"}
-        super().__init__(token, oid, "Energy", date, params)
+        super().__init__(token, oid, "Energy", date, self._BASE_PARAMS)
 
     def handle_response(self, data):
         return responses.LastDataExactResponse(data)
@@ -183,7 +227,7 @@ class LastDataExactRequest(DataRequest):
 class AllDataRequest(DataRequest):
     def __init__(self, token, oid, interval):
         """interval is year or month"""
-        params = {"period": "infinite", "interval": interval, "unit": "kWh"}
+        params = (("period", "infinite"), ("interval", interval), ("unit", "kWh"))
         super().__init__(token, oid, "Energy", datetime.today(), params)
 
     def handle_response(self, data):
@@ -227,13 +271,13 @@ class EnergyBalanceRequest(RequestBase):
         - day: day, hour, fifteen
         """
         super().__init__(service="data", token=token)
-        params = {
-            "period": period,
-            "interval": interval,
-            "culture": "en-gb",
-            "identifier": token.identifier,
-            "unit": "kWh",
-        }
+        params = (
+            ("period", period),
+            ("interval", interval),
+            ("culture", "en-gb"),
+            ("identifier", token.identifier),
+            ("unit", "kWh"),
+        )
         data_type = "energybalancetotal" if total else "energybalance"
         self.prepare_url([oid, "sets", data_type, date.strftime("%Y-%m-%d")], params)
 
@@ -253,21 +297,21 @@ class LogbookRequest(RequestBase):
         error=True,
     ):
         super().__init__(service="eventlist", token=token)
-        params = {
-            "culture": "en-gb",
-            "identifier": token.identifier,
-            "confirmation": "unconfirmed",
-        }
+        params = [
+            ("culture", "en-gb"),
+            ("identifier", token.identifier),
+            ("confirmation", "unconfirmed"),
+        ]
         if date_from:
-            params["date-from"] = date_from.strftime("%Y-%m-%d")
+            params.append(("date-from", date_from.strftime("%Y-%m-%d")))
         if info:
-            params["info"] = "true"
+            params.append(("info", "true"))
         if warning:
-            params["warning"] = "true"
+            params.append(("warning", "true"))
         if failure:
-            params["disturbance"] = "true"
+            params.append(("disturbance", "true"))
         if error:
-            params["error"] = "true"
+            params.append(("error", "true"))
         self.prepare_url([oid], params)
 
     def handle_response(self, data):
@@ -18,9 +18,37 @@
 from collections import namedtuple
 from datetime import datetime
 
+import functools
 import logging
-import xml.etree.ElementTree as ET
-from xml.sax.saxutils import unescape
+from html import unescape
+
+try:
+    from lxml import etree as ET
+
+    # One parser instance reused for every response; constructing it per
+    # parse would make libxml2 reallocate its internal buffers each time.
+    _XML_PARSER = ET.XMLParser(
+        resolve_entities=False,
+        no_network=True,
+        huge_tree=False,
+        collect_ids=False,
+        remove_blank_text=True,
+    )
+
+    def _fromstring(data):
+        if isinstance(data, str):
+            # lxml rejects str input that carries an XML encoding
+            # declaration.
+            data = data.encode("utf-8")
+        return ET.fromstring(data, _XML_PARSER)
+
+except ImportError:
+    import xml.etree.ElementTree as ET
+
+    _fromstring = ET.fromstring
+
+
+log = logging.getLogger(__name__)
 
 
 class Error(Exception):
@@ -43,6 +71,75 @@ class ResponseError(Error):
         return s
 
 
+def _find_or_raise(element, tag):
+    child = element.find(tag)
+    if child is None:
+        raise MalformedResponseError("Missing %s tag" % tag)
+    return child
+
+
+def _get_or_raise(element, attribute):
+    value = element.get(attribute)
+    if value is None:
+        raise MalformedResponseError(
+            "Missing %s attribute in %s tag" % (attribute, element.tag)
+        )
+    return value
+
+
+def _kwh_to_wh(kwh):
+    # Shift the decimal point three places with string arithmetic; going
+    # through float() costs more and can lose a Wh to binary rounding
+    # (e.g. int(float("8.3") * 1000) == 8299).
+    if kwh is None:
+        return None
+    if "." in kwh:
+        (whole, frac) = kwh.split(".", 1)
+        frac = int((frac + "000")[:3])
+        if whole.startswith("-"):
+            return int(whole) * 1000 - frac
+        return int(whole) * 1000 + frac
+    return int(kwh) * 1000
+
+
+def _wh_to_wh(wh):
+    if wh is None:
+        return None
+    return int(float(wh))
+
+
+@functools.lru_cache(maxsize=4096)
+def _parse_ts(timestamp, ts_format):
+    """datetime.strptime with a cache and fast paths for hot formats.
+
+    strptime re-parses the format string on every call; the formats
+    used by the per-entry loops are fixed and the timestamps repeat
+    both within and across responses (96 possible "%H:%M" values).
+    """
+    if ts_format == "%H:%M":
+        (hour, minute) = timestamp.split(":")
+        return datetime(1900, 1, 1, int(hour), int(minute))
+    if ts_format == "%d/%m/%Y":
+        (day, month, year) = timestamp.split("/")
+        return datetime(int(year), int(month), int(day))
+    if ts_format == "%m/%Y":
+        (month, year) = timestamp.split("/")
+        return datetime(int(year), int(month), 1)
+    if ts_format == "%Y":
+        return datetime(int(timestamp), 1, 1)
+    if ts_format == "%m/%d/%Y %I:%M:%S %p":
+        (day_part, time_part, ampm) = timestamp.split(" ")
+        (month, day, year) = day_part.split("/")
+        (hour, minute, second) = time_part.split(":")
+        hour = int(hour) % 12
+        if ampm.upper() == "PM":
+            hour += 12
+        return datetime(
+            int(year), int(month), int(day), hour, int(minute), int(second)
+        )
+    return datetime.strptime(timestamp, ts_format)
+
+
 Yield = namedtuple("Yield", ["timestamp", "absolute", "difference"])
 Power = namedtuple("Power", ["timestamp", "power", "min", "max"])
 Parameter = namedtuple("Parameter", ["value", "changed"])
@@ -55,40 +152,38 @@ EnergyBalance = namedtuple(
 
 
 class ResponseBase(object):
+    __slots__ = ("log", "creation_date", "method")
+
     def __init__(self, data):
         super().__init__()
-        self.log = logging.getLogger(__name__)
+        self.log = log
         self.parse(data)
 
     def log_response(self, data):
-        self.log.debug("Response: %s", data)
+        # Skip the call entirely for large XML payloads when debug
+        # logging is off.
+        if self.log.isEnabledFor(logging.DEBUG):
+            self.log.debug("Response: %s", data)
 
     def get_creation_date(self):
-        return datetime.strptime(self.creation_date, "%m/%d/%Y %I:%M:%S %p")
+        return _parse_ts(self.creation_date, "%m/%d/%Y %I:%M:%S %p")
 
-    def kwh_to_wh(self, kwh):
-        if kwh is None:
-            return None
-        return int(float(kwh) * 1000)
+    @staticmethod
+    def kwh_to_wh(kwh):
+        return _kwh_to_wh(kwh)
 
-    def find_or_raise(self, element, tag):
-        child = element.find(tag)
-        if child is None:
-            raise MalformedResponseError("Missing %s tag" % tag)
-        return child
+    @staticmethod
+    def find_or_raise(element, tag):
+        return _find_or_raise(element, tag)
 
-    def get_or_raise(self, element, attribute):
-        value = element.get(attribute)
-        if value is None:
-            raise MalformedResponseError(
-                "Missing %s attribute in %s tag" % (attribute, element.tag)
-            )
-        return value
+    @staticmethod
+    def get_or_raise(element, attribute):
+        return _get_or_raise(element, attribute)
 
     def parse(self, data, name=None):
         self.log_response(data)
 
-        root = ET.fromstring(data)
+        root = _fromstring(data)
         if root.tag != "sma.sunnyportal.services":
             raise MalformedResponseError("Unknown root tag")
 
@@ -102,15 +197,22 @@ class ResponseBase(object):
 
             raise ResponseError(msg, error.findtext("code"))
 
-        self.creation_date = self.get_or_raise(service, "creation-date")
-        self.method = self.get_or_raise(service, "method").upper()
-
-        if name is None:
-            name = self.get_or_raise(service, "name")
+        a = service.attrib
+        try:
+            self.creation_date = a["creation-date"]
+            self.method = a["method"].upper()
+            if name is None:
+                name = a["name"]
+        except KeyError as e:
+            raise MalformedResponseError(
+                "Missing %s attribute in %s tag" % (e.args[0], service.tag)
+            )
         return self.find_or_raise(service, name)
 
 
 class AuthenticationResponse(ResponseBase):
+    __slots__ = ("server_offset", "identifier", "identifier_lower_bytes", "key")
+
     def parse(self, data):
         tag = super().parse(data)
 
@@ -118,26 +220,47 @@ class AuthenticationResponse(ResponseBase):
             raise ResponseError("Authentication failed")
 
         self.server_offset = datetime.now() - self.get_creation_date()
-        self.identifier = self.get_or_raise(tag, "identifier")
-        if self.method != "DELETE":
-            self.key = self.get_or_raise(tag, "key")
+        a = tag.attrib
+        try:
+            self.identifier = a["identifier"]
+            # Precomputed for the request signature, which needs these
+            # bytes on every signed request.
+            self.identifier_lower_bytes = self.identifier.lower().encode()
+            if self.method != "DELETE":
+                self.key = a["key"]
+        except KeyError as e:
+            raise MalformedResponseError(
+                "Missing %s attribute in %s tag" % (e.args[0], tag.tag)
+            )
 
 
 class PlantListResponse(ResponseBase):
+    __slots__ = ("plants",)
+
     def parse(self, data):
-        self.plants = []
-        for p in super().parse(data).iterfind("plant"):
-            self.plants.append(
-                {
-                    "oid": self.get_or_raise(p, "oid"),
-                    "name": self.get_or_raise(p, "name"),
-                }
-            )
+        go = _get_or_raise
+        self.plants = [
+            {"oid": go(p, "oid"), "name": go(p, "name")}
+            for p in super().parse(data).iterfind("plant")
+        ]
 
 
 class PlantProfileResponse(ResponseBase):
-    def kwp_to_wp(self, kwp):
-        return self.kwh_to_wh(kwp)
+    __slots__ = (
+        "name",
+        "peak_power",
+        "city_country",
+        "start_date",
+        "description",
+        "plant_image",
+        "production_data",
+        "inverters",
+        "communication_products",
+    )
+
+    @staticmethod
+    def kwp_to_wp(kwp):
+        return _kwh_to_wh(kwp)
 
     def parse(self, data):
         tag = super().parse(data)
@@ -145,22 +268,21 @@ class PlantProfileResponse(ResponseBase):
         self.name = tag.find("name").text
         self.peak_power = self.kwp_to_wp(tag.find("peak-power").text)
         self.city_country = tag.find("city-country").text
-        self.start_date = datetime.strptime(tag.find("start-date").text, "%d/%m/%Y")
+        self.start_date = _parse_ts(tag.find("start-date").text, "%d/%m/%Y")
 
         description = tag.find("description")
         if description is not None:
-            self.description = (
-                tag.find("description").text.replace("<br />", "").rstrip()
-            )
+            self.description = description.text.replace("<br />", "").rstrip()
         else:
             self.description = None
 
         plant_image = tag.find("plant-image")
         if plant_image is not None:
+            a = plant_image.attrib
             self.plant_image = {
                 "image": plant_image.text,
-                "width": int(plant_image.attrib["width"]),
-                "height": int(plant_image.attrib["height"]),
+                "width": int(a["width"]),
+                "height": int(a["height"]),
             }
         else:
             self.plant_image = None
@@ -171,73 +293,92 @@ class PlantProfileResponse(ResponseBase):
                 return []
             return element.findall(children)
 
-        self.production_data = {}
-        for channel in findall(tag, "production-data", "channel"):
-            self.production_data[channel.attrib["meta-name"]] = channel.text
+        self.production_data = {
+            channel.attrib["meta-name"]: channel.text
+            for channel in findall(tag, "production-data", "channel")
+        }
 
         self.inverters = []
         for inverter in findall(tag, "inverters", "inverter"):
+            a = inverter.attrib
             self.inverters.append(
                 {
-                    "count": int(inverter.attrib["count"]),
-                    "deviceIcon": inverter.attrib["deviceIcon"],
+                    "count": int(a["count"]),
+                    "deviceIcon": a["deviceIcon"],
                     "text": inverter.text,
                 }
             )
 
         self.communication_products = []
         for product in findall(tag, "communicationProducts", "communicationProduct"):
+            a = product.attrib
             self.communication_products.append(
                 {
-                    "count": int(product.attrib["count"]),
-                    "deviceIcon": product.attrib["deviceIcon"],
+                    "count": int(a["count"]),
+                    "deviceIcon": a["deviceIcon"],
                     "name": product.text,
                 }
             )
 
 
 class PlantDeviceListResponse(ResponseBase):
+    __slots__ = ("devices",)
+
     def parse(self, data):
         self.devices = []
         for d in super().parse(data, "devicelist").iterfind("device"):
-            startdate = datetime.strptime(
-                self.get_or_raise(d, "startdate"), "%m/%d/%Y %I:%M:%S %p"
-            )
-            self.devices.append(
-                {
-                    "oid": self.get_or_raise(d, "oid"),
-                    "name": self.get_or_raise(d, "name"),
-                    "class": self.get_or_raise(d, "class"),
-                    "serialnumber": self.get_or_raise(d, "serialnumber"),
-                    "type-id": self.get_or_raise(d, "type-id"),
-                    "startdate": startdate,
-                }
-            )
+            a = d.attrib
+            try:
+                self.devices.append(
+                    {
+                        "oid": a["oid"],
+                        "name": a["name"],
+                        "class": a["class"],
+                        "serialnumber": a["serialnumber"],
+                        "type-id": a["type-id"],
+                        "startdate": _parse_ts(
+                            a["startdate"], "%m/%d/%Y %I:%M:%S %p"
+                        ),
+                    }
+                )
+            except KeyError as e:
+                raise MalformedResponseError(
+                    "Missing %s attribute in %s tag" % (e.args[0], d.tag)
+                )
 
 
 class PlantDeviceParametersResponse(ResponseBase):
+    __slots__ = ("parameters",)
+
     def parse(self, data):
         self.parameters = {}
         for p in super().parse(data, "parameterlist").iterfind("parameter"):
-            name = self.get_or_raise(p, "parameter-name")
-            value = self.get_or_raise(p, "parameter-value")
-            changed = datetime.strptime(
-                self.get_or_raise(p, "last-change"), "%m/%d/%Y %I:%M:%S %p"
-            )
+            a = p.attrib
+            try:
+                name = a["parameter-name"]
+                value = a["parameter-value"]
+                changed = _parse_ts(a["last-change"], "%m/%d/%Y %I:%M:%S %p")
+            except KeyError as e:
+                raise MalformedResponseError(
+                    "Missing %s attribute in %s tag" % (e.args[0], p.tag)
+                )
             self.parameters[name] = Parameter(value, changed)
 
 
 class DataResponse(ResponseBase):
+    __slots__ = ()
+
     def parse_timestamp(self, tag, ts_format):
-        return datetime.strptime(self.get_or_raise(tag, "timestamp"), ts_format)
+        return _parse_ts(_get_or_raise(tag, "timestamp"), ts_format)
 
     def parse_abs_diff(self, tag):
-        absolute = self.kwh_to_wh(tag.get("absolute"))
-        difference = self.kwh_to_wh(tag.get("difference"))
-        return (absolute, difference)
+        a = tag.attrib
+        return (_kwh_to_wh(a.get("absolute")), _kwh_to_wh(a.get("difference")))
 
 
 class LastDataExactResponse(DataResponse):
+    __slots__ = ("day", "hour")
+
     def parse(self, data):
         tag = super().parse(data)
         tag = self.find_or_raise(tag, "./Energy/channel")
@@ -261,164 +402,236 @@ class LastDataExactResponse(DataResponse):
 
 
 class AllDataResponse(DataResponse):
+    __slots__ = ("start_timestamp", "years", "months")
+
     def parse(self, data):
         tag = super().parse(data)
         tag = self.find_or_raise(tag, "./Energy/channel/infinite")
         self.start_timestamp = self.parse_timestamp(tag, "%d/%m/%Y %H:%M")
 
-        fmt = ("year", "%Y")
-        if tag.find("month") is not None:
-            fmt = ("month", "%m/%Y")
-
+        # One pass over the children both decides between year and month
+        # mode and accumulates the entries.
+        name = "year"
         energy = []
-        for entry in tag.iterfind(fmt[0]):
-            (absolute, difference) = self.parse_abs_diff(entry)
-            if absolute is not None and difference is not None:
-                date = self.parse_timestamp(entry, fmt[1])
-                energy.append(Yield(date, absolute, difference))
-        setattr(self, "%ss" % fmt[0], energy)
+        (k2w, go, append) = (_kwh_to_wh, _get_or_raise, energy.append)
+        for entry in tag:
+            if entry.tag == "month":
+                (name, ts_format) = ("month", "%m/%Y")
+            elif entry.tag == "year":
+                ts_format = "%Y"
+            else:
+                continue
+            a = entry.attrib
+            absolute = a.get("absolute")
+            difference = a.get("difference")
+            if absolute is None or difference is None:
+                continue
+            date = _parse_ts(go(entry, "timestamp"), ts_format)
+            append(Yield(date, k2w(absolute), k2w(difference)))
+        setattr(self, "%ss" % name, energy)
 
 
 class OverviewResponse(DataResponse):
+    __slots__ = ("absolute", "difference", "date")
+
     def parse_abs_diff_date(self, tag, period, date_format):
-        summary = tag.find("./channel/%s[@absolute]" % period)
-        if summary is not None:
+        channel = self.find_or_raise(tag, "channel")
+        summary = self.find_or_raise(channel, period)
+        if summary.get("absolute") is not None:
             (self.absolute, self.difference) = self.parse_abs_diff(summary)
         else:
             (self.absolute, self.difference) = (None, None)
-            summary = self.find_or_raise(tag, "./channel/%s" % period)
         self.date = self.parse_timestamp(summary, date_format).date()
+        return summary
 
 
 class DayOverviewResponse(OverviewResponse):
+    __slots__ = ("quarter", "include_all", "power_measurements")
+
     def __init__(self, data, quarter, include_all):
         self.quarter = quarter
         self.include_all = include_all
         super().__init__(data)
 
-    def kw_to_w(self, kw):
-        return self.kwh_to_wh(kw)
+    @staticmethod
+    def kw_to_w(kw):
+        return _kwh_to_wh(kw)
 
     def parse(self, data):
         tag = super().parse(data)
         tag_type = "day-fifteen" if self.quarter else "day"
         tag = self.find_or_raise(tag, "overview-%s-total" % tag_type)
 
-        self.parse_abs_diff_date(tag, "day", "%d/%m/%Y")
+        day = self.parse_abs_diff_date(tag, "day", "%d/%m/%Y")
 
         self.power_measurements = []
         tag_name = "fiveteen" if self.quarter else "hour"
-        for entry in tag.iterfind("./channel/day/%s" % tag_name):
-            mean = self.kw_to_w(entry.get("mean"))
-            if self.include_all or mean is not None:
-                time = self.parse_timestamp(entry, "%H:%M")
-                time = datetime.combine(self.date, time.time())
-                pmin = self.kw_to_w(entry.get("min"))
-                pmax = self.kw_to_w(entry.get("max"))
-                self.power_measurements.append(Power(time, mean, pmin, pmax))
+        (k2w, go, append) = (
+            _kwh_to_wh,
+            _get_or_raise,
+            self.power_measurements.append,
+        )
+        (date, include_all, combine) = (self.date, self.include_all, datetime.combine)
+        for entry in day:
+            if entry.tag != tag_name:
+                continue
+            a = entry.attrib
+            mean = k2w(a.get("mean"))
+            if include_all or mean is not None:
+                time = combine(date, _parse_ts(go(entry, "timestamp"), "%H:%M").time())
+                append(Power(time, mean, k2w(a.get("min")), k2w(a.get("max"))))
 
 
 class MonthOverviewResponse(OverviewResponse):
+    __slots__ = ("days",)
+
     def parse(self, data):
         tag = super().parse(data)
         tag = self.find_or_raise(tag, "overview-month-total")
 
-        self.parse_abs_diff_date(tag, "month", "%m/%Y")
+        month = self.parse_abs_diff_date(tag, "month", "%m/%Y")
 
         self.days = []
-        for entry in tag.iterfind("./channel/month/day"):
-            (absolute, difference) = self.parse_abs_diff(entry)
-            if absolute is not None and difference is not None:
-                date = self.parse_timestamp(entry, "%d/%m/%Y")
-                self.days.append(Yield(date, absolute, difference))
+        (k2w, go, append) = (_kwh_to_wh, _get_or_raise, self.days.append)
+        for entry in month:
+            if entry.tag != "day":
+                continue
+            a = entry.attrib
+            absolute = a.get("absolute")
+            difference = a.get("difference")
+            if absolute is None or difference is None:
+                continue
+            date = _parse_ts(go(entry, "timestamp"), "%d/%m/%Y")
+            append(Yield(date, k2w(absolute), k2w(difference)))
 
 
 class YearOverviewResponse(OverviewResponse):
+    __slots__ = ("months",)
+
     def parse(self, data):
         tag = super().parse(data)
         tag = self.find_or_raise(tag, "overview-year-total")
 
-        self.parse_abs_diff_date(tag, "year", "%Y")
+        year = self.parse_abs_diff_date(tag, "year", "%Y")
 
         self.months = []
-        for entry in tag.iterfind("./channel/year/month"):
-            (absolute, difference) = self.parse_abs_diff(entry)
-            if absolute is not None and difference is not None:
-                date = self.parse_timestamp(entry, "%m/%Y")
-                self.months.append(Yield(date, absolute, difference))
+        (k2w, go, append) = (_kwh_to_wh, _get_or_raise, self.months.append)
+        for entry in year:
+            if entry.tag != "month":
+                continue
+            a = entry.attrib
+            absolute = a.get("absolute")
+            difference = a.get("difference")
+            if absolute is None or difference is None:
+                continue
+            date = _parse_ts(go(entry, "timestamp"), "%m/%Y")
+            append(Yield(date, k2w(absolute), k2w(difference)))
 
 
 class EnergyBalanceResponse(DataResponse):
+    __slots__ = ("months", "days", "day")
+
     def parse(self, data):
         tag = super().parse(data)
         tag = self.find_or_raise(tag, "energybalance")
 
         if tag.get("unit") == "kWh":
-            converter = self.kwh_to_wh
+            converter = _kwh_to_wh
         else:
             assert tag.get("unit") == "Wh"
-            converter = lambda wh: None if wh is None else int(float(wh))
-
-        if tag.find("./*/month") is not None:
-            self.months = []
-            for entry in tag.iterfind("./*/month"):
-                date = self.parse_timestamp(entry, "%m/%Y")
-                b = self.parse_entry(entry, date, converter)
-                if b is not None:
-                    self.months.append(b)
-            print(self.months)
-        elif tag.find("./*/day") is not None:
-            self.days = []
-            for entry in tag.iterfind("./*/day"):
-                date = self.parse_timestamp(entry, "%d/%m/%Y")
-                b = self.parse_entry(entry, date, converter)
-                if b is not None:
-                    self.days.append(b)
-        elif tag.find("./day") is not None:
-            entry = tag.find("./day")
-            date = self.parse_timestamp(entry, "%d/%m/%Y")
-            self.day = self.parse_entry(entry, date, converter)
+            converter = _wh_to_wh
+
+        # One pass over the tree both decides which of the three layouts
+        # the server used and accumulates the entries.
+        pe = self.parse_entry
+        months = None
+        days = None
+        day = None
+        has_day = False
+        for child in tag:
+            if child.tag == "day":
+                has_day = True
+                a = child.attrib
+                day = pe(a, _parse_ts(self._timestamp(child, a), "%d/%m/%Y"), converter)
+                continue
+            for entry in child:
+                if entry.tag == "month":
+                    if months is None:
+                        months = []
+                    a = entry.attrib
+                    b = pe(a, _parse_ts(self._timestamp(entry, a), "%m/%Y"), converter)
+                    if b is not None:
+                        months.append(b)
+                elif entry.tag == "day":
+                    if days is None:
+                        days = []
+                    a = entry.attrib
+                    b = pe(
+                        a, _parse_ts(self._timestamp(entry, a), "%d/%m/%Y"), converter
+                    )
+                    if b is not None:
+                        days.append(b)
+
+        if months is not None:
+            self.months = months
+        elif days is not None:
+            self.days = days
+        elif has_day:
+            self.day = day
         else:
             raise NotImplementedError("unsupported response")
 
-    def parse_entry(self, entry, timestamp, converter):
-        consumption = Consumption(
-            converter(entry.get("external-supply")),
-            converter(entry.get("self-supply")),
-            converter(entry.get("direct-consumption")),
-        )
-        if any(m is None for m in consumption):
+    @staticmethod
+    def _timestamp(entry, a):
+        timestamp = a.get("timestamp")
+        if timestamp is None:
+            raise MalformedResponseError(
+                "Missing timestamp attribute in %s tag" % entry.tag
+            )
+        return timestamp
+
+    def parse_entry(self, a, timestamp, converter):
+        external = a.get("external-supply")
+        internal = a.get("self-supply")
+        direct = a.get("direct-consumption")
+        if external is None or internal is None or direct is None:
             return None
 
-        generation = Generation(
-            converter(entry.get("pv-generation")),
-            converter(entry.get("self-consumption")),
-            converter(entry.get("feed-in")),
-        )
-        if any(m is None for m in generation):
+        generated = a.get("pv-generation")
+        self_consumption = a.get("self-consumption")
+        feed_in = a.get("feed-in")
+        if generated is None or self_consumption is None or feed_in is None:
             return None
 
-        battery = Battery(
-            converter(entry.get("battery-charging")),
-            converter(entry.get("battery-discharging")),
-        )
-        if all(m is None for m in battery):
+        charge = a.get("battery-charging")
+        discharge = a.get("battery-discharging")
+        if charge is None and discharge is None:
             battery = None
-
-        return EnergyBalance(timestamp, consumption, generation, battery)
+        else:
+            battery = Battery(converter(charge), converter(discharge))
+
+        return EnergyBalance(
+            timestamp,
+            Consumption(converter(external), converter(internal), converter(direct)),
+            Generation(
+                converter(generated), converter(self_consumption), converter(feed_in)
+            ),
+            battery,
+        )
 
 
 class LogbookResponse(ResponseBase):
+    __slots__ = ("entries",)
+
     def parse(self, data):
         self.entries = []
         for e in super().parse(data).iterfind("entry"):
             device = self.find_or_raise(e, "device")
 
-            description = self.find_or_raise(e, "description").text
-            description = unescape(description, {"&apos;": "'", "&quot;": '"'})
+            description = unescape(self.find_or_raise(e, "description").text)
 
             event_date = self.find_or_raise(e, "date").text
-            event_date = datetime.strptime(event_date, "%d/%m/%Y %H:%M:%S")
+            event_date = _parse_ts(event_date, "%d/%m/%Y %H:%M:%S")
 
             self.entries.append(
                 {